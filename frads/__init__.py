@@ -48,13 +48,9 @@ or other site and building features that can change parametrically
 or on a time-step basis.
 """
 
+import importlib
 import logging
-
-from .ep2rad import epmodel_to_radmodel
-
-from .eplus import load_energyplus_model, EnergyPlusSetup, ep_datetime_parser
-
-from .eplus_model import EnergyPlusModel
+from typing import Any
 
 from .matrix import (
     load_matrix,
@@ -96,21 +92,37 @@ from .sky import (
 
 from .utils import gen_grid, unpack_primitives
 
-from .window import (
-    create_glazing_system,
-    Gap,
-    Gas,
-    GlazingSystem,
-    AIR,
-    ARGON,
-    KRYPTON,
-    XENON,
-)
-
 __version__ = "1.2.4"
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# EnergyPlus and pywincalc bindings take seconds to import, so the modules
+# that depend on them are only imported when one of their names is accessed.
+_LAZY_IMPORTS = {
+    "epmodel_to_radmodel": "ep2rad",
+    "load_energyplus_model": "eplus",
+    "EnergyPlusSetup": "eplus",
+    "ep_datetime_parser": "eplus",
+    "EnergyPlusModel": "eplus_model",
+    "create_glazing_system": "window",
+    "Gap": "window",
+    "Gas": "window",
+    "GlazingSystem": "window",
+    "AIR": "window",
+    "ARGON": "window",
+    "KRYPTON": "window",
+    "XENON": "window",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AIR",
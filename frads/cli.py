@@ -4,6 +4,7 @@ Executive command-line program for Radiance matrix-based simulation.
 
 import argparse
 import configparser
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
@@ -15,13 +16,9 @@ import pyradiance as pr
 from pyradiance import SamplingParameters, lib
 from pyradiance import param as rparam
 from pyradiance import model as rmodel
-import pywincalc as pwc
 
 from frads import ncp
-from frads.eplus import load_energyplus_model
-from frads.ep2rad import epmodel_to_radmodel
 from frads.room import make_room
-from frads.window import PaneRGB, get_glazing_primitive
 from frads.matrix import (
     load_matrix,
     Matrix,
@@ -52,6 +49,15 @@ from frads.utils import (
 logger: logging.Logger = logging.getLogger("frads")
 
 
+@lru_cache(maxsize=None)
+def _view_parser() -> argparse.ArgumentParser:
+    """View argument parser, built once and reused across parse_vu calls."""
+    vparser = rparam.add_view_args(argparse.ArgumentParser())
+    vparser.add_argument("-x", type=int)
+    vparser.add_argument("-y", type=int)
+    return vparser
+
+
 def parse_vu(vu_str: str) -> Optional[rmodel.View]:
     """Parse view string into a View object.
 
@@ -65,10 +71,7 @@ def parse_vu(vu_str: str) -> Optional[rmodel.View]:
     if vu_str.strip() == "":
         return
     args_list = vu_str.strip().split()
-    vparser = argparse.ArgumentParser()
-    vparser = rparam.add_view_args(vparser)
-    vparser.add_argument("-x", type=int)
-    vparser.add_argument("-y", type=int)
+    vparser = _view_parser()
     args, _ = vparser.parse_known_args(args_list)
     if args.vf is not None:
         args, _ = vparser.parse_known_args(
@@ -95,6 +98,16 @@ def parse_vu(vu_str: str) -> Optional[rmodel.View]:
     return view
 
 
+@lru_cache(maxsize=None)
+def _mrad_default_config() -> Dict[str, Dict[str, str]]:
+    """Raw sections of the bundled mrad defaults, parsed once per process."""
+    defaults = configparser.ConfigParser(
+        inline_comment_prefixes="#", interpolation=None
+    )
+    defaults.read(Path(__file__).parent / "data" / "mrad_default.cfg")
+    return {sec: dict(defaults.items(sec, raw=True)) for sec in defaults.sections()}
+
+
 def parse_mrad_config(cfg_path: Path) -> Dict[str, dict]:
     """
     Parse mrad configuration file.
@@ -119,7 +132,7 @@ def parse_mrad_config(cfg_path: Path) -> Dict[str, dict]:
             "view": parse_vu,
         },
     )
-    config.read(Path(__file__).parent / "data" / "mrad_default.cfg")
+    config.read_dict(_mrad_default_config())
     config.read(cfg_path)
     # Convert config to dict
     config_dict = {}
@@ -165,7 +178,7 @@ def parse_mrad_config(cfg_path: Path) -> Dict[str, dict]:
             name = gfile.stem
             with open(gfile) as f:
                 config_dict["model"]["sensors"][name] = {
-                    "data": [[float(v) for v in l.split()] for l in f.readlines()]
+                    "data": np.loadtxt(f, ndmin=2).tolist()
                 }
     elif (grid_paths := config["RaySender"].getpaths("grid_surface")) is not None:
         for gpath in grid_paths:
@@ -403,6 +416,11 @@ def mrad() -> None:
 
 def glaze(args) -> None:
     """Command-line program for generating BRTDfunc for glazing system."""
+    # pywincalc is slow to import, so only pay for it when glazing.
+    import pywincalc as pwc
+
+    from frads.window import PaneRGB, get_glazing_primitive
+
     if args.optics is not None:
         panes = [pwc.parse_optics_file(fpath) for fpath in args.optics]
     else:
@@ -445,8 +463,10 @@ def glaze(args) -> None:
 def gengrid(args) -> None:
     """Commandline program for generating a grid of sensor points."""
     prims = unpack_primitives(args.surface)
-    polygon_prims = [prim for prim in prims if prim.ptype == "polygon"]
-    polygon = parse_polygon(polygon_prims[0]).flip()
+    polygon_prim = next((prim for prim in prims if prim.ptype == "polygon"), None)
+    if polygon_prim is None:
+        raise ValueError(f"No polygon found in {args.surface}")
+    polygon = parse_polygon(polygon_prim).flip()
     if args.op:
         polygon = polygon.flip()
     grid_list = gen_grid(polygon, args.height, args.spacing)
@@ -468,6 +488,10 @@ def gengrid(args) -> None:
 
 def epjson2rad_cmd() -> None:
     """Command-line interface to converting epjson to rad."""
+    # EnergyPlus bindings are slow to import, so only pay for them here.
+    from frads.ep2rad import epmodel_to_radmodel
+    from frads.eplus import load_energyplus_model
+
     parser = argparse.ArgumentParser()
     parser.add_argument("fpath", type=Path)
     parser.add_argument("-run", action="store_true", default=False)
@@ -480,10 +504,28 @@ def epjson2rad_cmd() -> None:
         write_ep_rad_model(f"{zone}.rad", zones[zone])
 
 
+def _group_surfaces_by_modifier(
+    prims: List[pr.Primitive],
+) -> List[List[pr.Primitive]]:
+    """Group polygon and ring primitives by their modifier in a single pass.
+
+    Args:
+        prims: List of primitives
+
+    Returns:
+        Lists of surface primitives, one per modifier
+    """
+    groups: Dict[str, List[pr.Primitive]] = {}
+    for prim in prims:
+        if prim.ptype in ("polygon", "ring"):
+            groups.setdefault(prim.modifier, []).append(prim)
+    return list(groups.values())
+
+
 def genmtx_pts_sky(args) -> None:
     """Generate a point to sky matrix."""
     with open(args.pts, "r", encoding="ascii") as rdr:
-        pts = [[float(i) for i in line.split()] for line in rdr.readlines()]
+        pts = np.loadtxt(rdr, ndmin=2).tolist()
     sender = SensorSender(sensors=pts)
     out = Path(f"{args.pts.stem}_{args.basis}sky.mtx")
     receiver = SkyReceiver(args.basis, out=out)
@@ -538,30 +580,23 @@ def genmtx_srf_sky(args) -> None:
 def genmtx_pts_srf(args) -> None:
     """Generate a point to surface matrix."""
     with open(args.pts, "r", encoding="ascii") as rdr:
-        pts = [[float(i) for i in line.split()] for line in rdr.readlines()]
+        pts = np.loadtxt(rdr, ndmin=2).tolist()
     sender = SensorSender(sensors=pts, ray_count=1)
     rprims = unpack_primitives(args.srf)
-    modifiers = {prim.modifier for prim in rprims if prim.ptype in ("polygon", "ring")}
     sys_paths = args.sys
     receivers = []
-    for mod in modifiers:
-        _receiver = [
-            prim
-            for prim in rprims
-            if prim.modifier == mod and prim.ptype in ("polygon", "ring")
-        ]
-        if _receiver != []:
-            outpath = Path(f"{args.pts.stem}_{args.srf.stem}.mtx")
-            receivers.append(
-                SurfaceReceiver(
-                    surfaces=_receiver,
-                    basis=args.basis,
-                    offset=args.offset,
-                    left_hand=False,
-                    source="glow",
-                    out=outpath,
-                )
+    for _receiver in _group_surfaces_by_modifier(rprims):
+        outpath = Path(f"{args.pts.stem}_{args.srf.stem}.mtx")
+        receivers.append(
+            SurfaceReceiver(
+                surfaces=_receiver,
+                basis=args.basis,
+                offset=args.offset,
+                left_hand=False,
+                source="glow",
+                out=outpath,
             )
+        )
     del args.pts, args.srf, args.sys, args.basis, args.offset, args.verbose, args.func
     mat = Matrix(sender, receivers, octree=None, surfaces=sys_paths)
     sparams = SamplingParameters()
@@ -580,28 +615,21 @@ def genmtx_vu_srf(args) -> None:
         yres=args.resolu[1],
     )
     rprims = unpack_primitives(args.srf)
-    modifiers = {prim.modifier for prim in rprims if prim.ptype in ("polygon", "ring")}
     sys_paths = args.sys
     receivers = []
-    for mod in modifiers:
-        _receiver = [
-            prim
-            for prim in rprims
-            if prim.modifier == mod and prim.ptype in ("polygon", "ring")
-        ]
-        if _receiver != []:
-            outpath = Path(f"{args.vu.stem}_{args.srf.stem}")
-            outpath.mkdir()
-            receivers.append(
-                SurfaceReceiver(
-                    surfaces=_receiver,
-                    basis=args.basis,
-                    offset=args.offset,
-                    left_hand=False,
-                    source="glow",
-                    out=outpath / "%04d.hdr",
-                )
+    for _receiver in _group_surfaces_by_modifier(rprims):
+        outpath = Path(f"{args.vu.stem}_{args.srf.stem}")
+        outpath.mkdir()
+        receivers.append(
+            SurfaceReceiver(
+                surfaces=_receiver,
+                basis=args.basis,
+                offset=args.offset,
+                left_hand=False,
+                source="glow",
+                out=outpath / "%04d.hdr",
             )
+        )
     del (
         args.vu,
         args.srf,
@@ -627,27 +655,20 @@ def genmtx_srf_srf(args) -> None:
         offset=args.offset[0],
     )
     rprims = unpack_primitives(args.rsrf)
-    modifiers = {prim.modifier for prim in rprims if prim.ptype in ("polygon", "ring")}
     sys_paths = args.sys
     receivers = []
-    for mod in modifiers:
-        _receiver = [
-            prim
-            for prim in rprims
-            if prim.modifier == mod and prim.ptype in ("polygon", "ring")
-        ]
-        if _receiver != []:
-            outpath = Path(f"{args.ssrf.stem}_{args.rsrf.stem}.mtx")
-            receivers.append(
-                SurfaceReceiver(
-                    surfaces=_receiver,
-                    basis=args.basis[1],
-                    offset=args.offset[1],
-                    left_hand=False,
-                    source="glow",
-                    out=outpath,
-                )
+    for _receiver in _group_surfaces_by_modifier(rprims):
+        outpath = Path(f"{args.ssrf.stem}_{args.rsrf.stem}.mtx")
+        receivers.append(
+            SurfaceReceiver(
+                surfaces=_receiver,
+                basis=args.basis[1],
+                offset=args.offset[1],
+                left_hand=False,
+                source="glow",
+                out=outpath,
             )
+        )
     del args.ssrf, args.rsrf, args.sys, args.basis, args.offset, args.verbose, args.func
     mat = Matrix(sender, receivers, octree=None, surfaces=sys_paths)
     sparams = SamplingParameters()
@@ -660,7 +681,7 @@ def genmtx_pts_sun(args) -> None:
     """Generate a point to sun matrix."""
     with open(args.pts, "r", encoding="ascii") as rdr:
         sender = SensorSender(
-            sensors=[[float(i) for i in line.split()] for line in rdr.readlines()],
+            sensors=np.loadtxt(rdr, ndmin=2).tolist(),
             ray_count=1,
         )
     receiver = SunReceiver(
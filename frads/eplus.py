@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Callable, Union
 import inspect
 import ast
+import re
 import tempfile
 
 from epmodel import epmodel as epm
@@ -20,6 +21,17 @@ from frads.eplus_model import EnergyPlusModel
 import numpy as np
 from pyenergyplus.api import EnergyPlusAPI
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_DIRECT_SOLAR = "Site Direct Solar Radiation Rate per Area"
+_DIFFUSE_SOLAR = "Site Diffuse Solar Radiation Rate per Area"
+_ENVIRONMENT = "Environment"
+_EP_DATETIME_RE = re.compile(r"\s*(\d+)/(\d+)\s+(\d+):(\d+):(\d+)")
+_ONE_DAY = datetime.timedelta(days=1)
+
 
 def ep_datetime_parser(inp: str):
     """Parse date and time from EnergyPlus output.
@@ -27,13 +39,12 @@ def ep_datetime_parser(inp: str):
     Args:
         inp: Date and time string from EnergyPlus output.
     """
-    date, time = inp.strip().split()
-    month, day = [int(i) for i in date.split("/")]
-    hr, mi, sc = [int(i) for i in time.split(":")]
+    match = _EP_DATETIME_RE.match(inp)
+    if match is None:
+        raise ValueError(f"Invalid EnergyPlus date time: {inp!r}")
+    month, day, hr, mi, sc = map(int, match.groups())
     if hr == 24 and mi == 0 and sc == 0:
-        return datetime.datetime(1900, month, day, 0, mi, sc) + datetime.timedelta(
-            days=1
-        )
+        return datetime.datetime(1900, month, day, 0, mi, sc) + _ONE_DAY
     else:
         return datetime.datetime(1900, month, day, hr, mi, sc)
 
@@ -98,6 +109,7 @@ class EnergyPlusSetup:
         self.variable_handles = {}
         self.actuator_handles = {}
         self.construction_handles = {}
+        self._handle_cache: Dict[tuple, int] = {}
         self.enable_radiance = enable_radiance
         self.api.runtime.callback_begin_new_environment(self.state, self._get_handles())
         self.actuators = []
@@ -105,6 +117,7 @@ class EnergyPlusSetup:
 
     def close(self):
         self.api.state_manager.delete_state(self.state)
+        self._handle_cache.clear()
 
     def __enter__(self):
         return self
@@ -301,12 +314,34 @@ class EnergyPlusSetup:
             self.api.exchange.request_variable(self.state, name, key)
             self.variable_handles[key][name] = None
 
+    def _cached_handle(self, kind: str, getter: Callable, state, *args) -> int:
+        """Look up a handle once per state; EnergyPlus calls the
+        begin-new-environment callback for every warmup and sizing period.
+        The callback receives the state pointer as a plain int, so the
+        pointer value itself is the key.
+        """
+        cache_key = (state, kind, *args)
+        handle = self._handle_cache.get(cache_key)
+        if handle is None:
+            handle = getter(state, *args)
+            if handle != -1:
+                self._handle_cache[cache_key] = handle
+        return handle
+
     def _get_handles(self):
+        encoded_cfs: Dict[str, bytes] = {}
+
         def callback_function(state):
             for key in self.variable_handles:
                 try:
                     for name in self.variable_handles[key]:
-                        handle = self.api.exchange.get_variable_handle(state, name, key)
+                        handle = self._cached_handle(
+                            "variable",
+                            self.api.exchange.get_variable_handle,
+                            state,
+                            name,
+                            key,
+                        )
                         if handle == -1:
                             raise ValueError(
                                 "Variable handle not found: "
@@ -318,7 +353,14 @@ class EnergyPlusSetup:
 
             if self.model.construction_complex_fenestration_state is not None:
                 for cfs in self.model.construction_complex_fenestration_state:
-                    handle = self.api.api.getConstructionHandle(state, cfs.encode())
+                    if cfs not in encoded_cfs:
+                        encoded_cfs[cfs] = cfs.encode()
+                    handle = self._cached_handle(
+                        "construction",
+                        self.api.api.getConstructionHandle,
+                        state,
+                        encoded_cfs[cfs],
+                    )
                     if handle == -1:
                         raise ValueError(
                             "Construction handle not found: " f"Construction = {cfs}"
@@ -469,20 +511,12 @@ class EnergyPlusSetup:
                     raise ValueError(f"Invalid number of arguments in {func}.")
                 self.request_variable(**key_value_dict)
             elif node.func.attr == "get_diffuse_horizontal_irradiance":
-                self.request_variable(
-                    name="Site Diffuse Solar Radiation Rate per Area", key="Environment"
-                )
+                self.request_variable(name=_DIFFUSE_SOLAR, key=_ENVIRONMENT)
             elif node.func.attr == "get_direct_normal_irradiance":
-                self.request_variable(
-                    name="Site Direct Solar Radiation Rate per Area", key="Environment"
-                )
+                self.request_variable(name=_DIRECT_SOLAR, key=_ENVIRONMENT)
             elif node.func.attr in ("calculate_wpi", "calculate_edgps"):
-                self.request_variable(
-                    name="Site Diffuse Solar Radiation Rate per Area", key="Environment"
-                )
-                self.request_variable(
-                    name="Site Direct Solar Radiation Rate per Area", key="Environment"
-                )
+                self.request_variable(name=_DIFFUSE_SOLAR, key=_ENVIRONMENT)
+                self.request_variable(name=_DIRECT_SOLAR, key=_ENVIRONMENT)
 
     def _check_actuators_from_callback(self, callable_nodes: List[ast.Call]) -> None:
         def get_zone_from_pair_arg(node: ast.Call) -> str:
@@ -556,9 +590,7 @@ class EnergyPlusSetup:
         Examples:
             >>> epsetup.get_direct_normal_irradiance()
         """
-        return self.get_variable_value(
-            "Site Direct Solar Radiation Rate per Area", "Environment"
-        )
+        return self.get_variable_value(_DIRECT_SOLAR, _ENVIRONMENT)
 
     def get_diffuse_horizontal_irradiance(self) -> float:
         """Get diffuse horizontal irradiance.
@@ -569,9 +601,7 @@ class EnergyPlusSetup:
         Example:
             epsetup.get_diffuse_horizontal_irradiance()
         """
-        return self.get_variable_value(
-            "Site Diffuse Solar Radiation Rate per Area", "Environment"
-        )
+        return self.get_variable_value(_DIFFUSE_SOLAR, _ENVIRONMENT)
 
     def calculate_wpi(self, zone: str, cfs_name: Dict[str, str]) -> np.ndarray:
         """Calculate workplane illuminance in a zone.
@@ -626,6 +656,21 @@ class EnergyPlusSetup:
         )
 
 
+def _load_json(fpath: Path) -> dict:
+    """Load a JSON file, using orjson if it is available.
+
+    Args:
+        fpath: Path to JSON file.
+
+    Returns:
+        JSON object.
+    """
+    if orjson is not None:
+        return orjson.loads(fpath.read_bytes())
+    with open(fpath) as f:
+        return json.load(f)
+
+
 def load_idf(fpath: Union[str, Path]) -> dict:
     """Load IDF file as JSON object.
 
@@ -651,17 +696,19 @@ def load_idf(fpath: Union[str, Path]) -> dict:
     if not fpath.exists():
         raise FileNotFoundError(f"File {fpath} not found.")
     api = EnergyPlusAPI()
-    state = api.state_manager.new_state()
-    api.runtime.set_console_output_status(state, False)
-    api.runtime.run_energyplus(state, ["--convert-only", str(fpath)])
-    api.state_manager.delete_state(state)
-    epjson_path = Path(fpath.with_suffix(".epJSON").name)
-    if not epjson_path.exists():
-        raise FileNotFoundError(f"Converted {str(epjson_path)} not found.")
-    with open(epjson_path) as f:
-        json_data = json.load(f)
-    epjson_path.unlink()
-    return json_data
+    # Convert into a private directory so concurrent loads of the same IDF
+    # do not overwrite or delete each other's epJSON.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state = api.state_manager.new_state()
+        api.runtime.set_console_output_status(state, False)
+        api.runtime.run_energyplus(
+            state, ["--convert-only", "--output-directory", tmpdir, str(fpath)]
+        )
+        api.state_manager.delete_state(state)
+        epjson_path = Path(tmpdir) / fpath.with_suffix(".epJSON").name
+        if not epjson_path.exists():
+            raise FileNotFoundError(f"Converted {epjson_path.name} not found.")
+        return _load_json(epjson_path)
 
 
 def load_energyplus_model(fpath: Union[str, Path]) -> EnergyPlusModel:
@@ -683,8 +730,7 @@ def load_energyplus_model(fpath: Union[str, Path]) -> EnergyPlusModel:
     if fpath.suffix == ".idf":
         json_data = load_idf(fpath)
     elif fpath.suffix == ".epJSON":
-        with open(fpath) as f:
-            json_data = json.load(f)
+        json_data = _load_json(fpath)
     else:
         raise ValueError(f"File {fpath} is not an IDF or epJSON file.")
     return EnergyPlusModel.model_validate(json_data)
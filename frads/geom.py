@@ -92,12 +92,9 @@ class Polygon:
         return normal_vector / np.linalg.norm(normal_vector)
 
     def _calculate_area(self) -> np.ndarray:
-        total = np.array((0.0, 0.0, 0.0))
-        for idx in range(1, len(self._vertices) - 1):
-            total += np.cross(
-                (self._vertices[idx] - self._vertices[0]),
-                (self._vertices[idx + 1] - self._vertices[0]),
-            )
+        # Fan triangulation from the first vertex over the vertex array.
+        edges = self._vertices[1:] - self._vertices[0]
+        total = np.cross(edges[:-1], edges[1:]).sum(axis=0)
         return abs(total * np.array((0.5, 0.5, 0.5)))
 
     def _calculate_centroid(self):
@@ -113,13 +110,7 @@ class Polygon:
             Scaled polygon
         """
 
-        new_vertices = []
-        for vert in self._vertices:
-            sx = center[0] + (vert[0] - center[0]) * scale_vect[0]
-            sy = center[1] + (vert[1] - center[1]) * scale_vect[1]
-            sz = center[2] + (vert[2] - center[2]) * scale_vect[2]
-            new_vertices.append(np.array([sx, sy, sz]))
-        return Polygon(new_vertices)
+        return Polygon(center + (self._vertices - center) * scale_vect)
 
     @property
     def extreme(self) -> Tuple[float, ...]:
@@ -145,8 +136,8 @@ class Polygon:
         Returns:
             Polygon: rotated polygon;
         """
-        ro_pts = [rotate_3d(v, center, vector, angle) for v in self._vertices]
-        return Polygon(ro_pts)
+        rmtx = rotation_matrix(vector, angle)
+        return Polygon((self._vertices - center) @ rmtx.T + center)
 
     def move(self, vector) -> "Polygon":
         """Return the moved polygon along a vector."""
@@ -213,24 +204,19 @@ def angle_between(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return angle
 
 
-def rotate_3d(
-    point: np.ndarray, center: np.ndarray, axis: np.ndarray, angle: float
-) -> np.ndarray:
+def rotation_matrix(axis: np.ndarray, angle: float) -> np.ndarray:
     """
-    Rotate a point around a center and axis
+    Rotation matrix around an axis through the origin
     Args:
-        point: the point to rotate
-        center: the rotation center
         axis: the rotation axis
         angle: the rotation angle in randians
     Returns:
-        the rotated point
+        the 3x3 rotation matrix
     """
-    translated_point = point - center
     ct = np.cos(angle)
     st = np.sin(angle)
     axisx, axisy, axisz = axis
-    rotation_matrix = np.array(
+    return np.array(
         [
             [
                 axisx**2 + (1 - axisx**2) * ct,
@@ -249,7 +235,22 @@ def rotate_3d(
             ],
         ]
     )
-    rotated = np.dot(rotation_matrix, translated_point)
+
+
+def rotate_3d(
+    point: np.ndarray, center: np.ndarray, axis: np.ndarray, angle: float
+) -> np.ndarray:
+    """
+    Rotate a point around a center and axis
+    Args:
+        point: the point to rotate
+        center: the rotation center
+        axis: the rotation axis
+        angle: the rotation angle in randians
+    Returns:
+        the rotated point
+    """
+    rotated = np.dot(rotation_matrix(axis, angle), point - center)
     return rotated + center
 
 
@@ -276,14 +277,24 @@ def convexhull(points: List[np.ndarray], normal: np.ndarray) -> Polygon:
         return pts
 
     def extend_pts(u, v, points):
-        """."""
-        if not points:
-            return []
-
-        vect2 = v - u
-        w = min(points, key=lambda p: np.dot(np.cross((p - u), vect2), normal))
-        p1, p2 = toleft(w, v, points), toleft(u, w, points)
-        return extend_pts(w, v, p1) + [w] + extend_pts(u, w, p2)
+        """Hull points left of u->v, expanded with an explicit stack."""
+        hull = []
+        stack = [(u, v, points)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, np.ndarray):
+                hull.append(item)
+                continue
+            u, v, points = item
+            if not points:
+                continue
+            vect2 = v - u
+            w = min(points, key=lambda p: np.dot(np.cross((p - u), vect2), normal))
+            # Pushed in reverse so the (w, v) side is emitted before w.
+            stack.append((u, w, toleft(u, w, points)))
+            stack.append(w)
+            stack.append((w, v, toleft(w, v, points)))
+        return hull
 
     u = min(points, key=lambda p: p[0])
     v = max(points, key=lambda p: p[0])
@@ -3,6 +3,7 @@ This module contains routines to generate sender and receiver objects, generate
 matrices by calling either rfluxmtx or rcontrib.
 """
 
+from functools import lru_cache
 import gc
 import logging
 import os
@@ -227,6 +228,25 @@ class SkyReceiver(Receiver):
         )
 
 
+@lru_cache(maxsize=8)
+def _sun_directions(mf: int) -> np.ndarray:
+    """Reinhart sun directions for a given subdivision, computed once per mf."""
+    nbins = 144 * mf**2 + 1
+    res = pr.rcalc(
+        inp=pr.cnt(nbins),
+        outform="f",
+        expr=f"MF:{mf};Rbin=recno;$1=Dx;$2=Dy;$3=Dz",
+        source="reinsrc.cal",
+    )
+    return np.frombuffer(res, dtype=np.single).reshape(nbins, 3)
+
+
+@lru_cache(maxsize=8)
+def _sun_modifiers(nbins: int) -> tuple:
+    """Sun modifier names sol0..sol{nbins-1}, built once per basis size."""
+    return tuple(f"sol{i}" for i in range(nbins))
+
+
 class SunReceiver(Receiver):
     """Sun as receiver object.
     The number of suns is reduced depending on the input.
@@ -260,26 +280,23 @@ class SunReceiver(Receiver):
             raise ValueError("Invalid Reinhart/Treganza basis", basis)
         mf = int(basis[-1])
         nbins = 144 * mf**2 + 1
-        res = pr.rcalc(
-            inp=pr.cnt(nbins),
-            outform="f",
-            expr=f"MF:{mf};Rbin=recno;$1=Dx;$2=Dy;$3=Dz",
-            source="reinsrc.cal",
-        )
-        sundirs = np.frombuffer(res, dtype=np.single).reshape(nbins, 3)
+        sundirs = _sun_directions(mf)
         sunvals = np.ones(BASIS_DIMENSION[basis])
         if sun_matrix is not None:
-            sunvals[np.sum(sun_matrix[1:, :, 0], axis=1) == 0] = 0
+            sunvals[~sun_matrix[1:, :, 0].any(axis=1)] = 0
         if window_normals is not None:
-            sunvals[np.dot(sundirs, np.array(window_normals).T).flatten() >= 0] = 0
+            # a sun is kept if it is visible through any of the windows
+            visible = (sundirs @ np.asarray(window_normals).T < 0).any(axis=1)
+            sunvals[~visible] = 0
+        names = _sun_modifiers(nbins)
         self.content = "\n".join(
-            f"void light sol{i} 0 0 3 {d} {d} {d} sol{i} source sun 0 0 4 {sundirs[i][0]:.6g} {sundirs[i][1]:.6g} {sundirs[i][2]:.6g} 0.533"
-            for i, d in enumerate(sunvals)
+            f"void light {n} 0 0 3 {d} {d} {d} {n} source sun 0 0 4 {x:.6g} {y:.6g} {z:.6g} 0.533"
+            for n, d, (x, y, z) in zip(names, sunvals.tolist(), sundirs.tolist())
         )
         if full_mod:
-            self.modifiers = [f"sol{i}" for i in range(nbins)]
+            self.modifiers = list(names)
         else:
-            self.modifiers = [f"sol{i}" for i in np.where(sunvals > 0)[0]]
+            self.modifiers = [names[i] for i in np.flatnonzero(sunvals)]
 
 
 class Matrix:
@@ -616,8 +633,10 @@ def load_binary_matrix(
         The matrix as a numpy array
     """
     npdtype = np.double if dtype.startswith("d") else np.single
-    if header:
-        buffer = pr.getinfo(buffer, strip_header=True)
+    if header and buffer.startswith(b"#?"):
+        # The header ends at the first empty line; slicing a memoryview
+        # avoids piping the whole matrix through getinfo to strip it.
+        buffer = memoryview(buffer)[buffer.index(b"\n\n") + 2 :]
     return np.frombuffer(buffer, dtype=npdtype).reshape(nrows, ncols, ncomp)
 
 
@@ -765,7 +784,7 @@ def rfluxmtx_markup(
     elif source == "light":
         source_prim = pr.Primitive("void", source, source_modifier, [], [1, 1, 1])
         header += str(source_prim)
-    content = ""
+    content = []
     for prim in surfaces:
         if prim.identifier in modifier_set:
             _identifier = "discarded"
@@ -782,9 +801,9 @@ def rfluxmtx_markup(
         new_prim = pr.Primitive(
             _modifier, prim.ptype, _identifier, prim.sargs, _real_args
         )
-        content += str(new_prim) + "\n"
+        content.append(f"{new_prim}\n")
 
-    return header + content
+    return header + "".join(content)
 
 
 def surfaces_view_factor(
@@ -34,7 +34,6 @@ from frads.sky import (
     parse_wea,
 )
 from frads.utils import (
-    minutes_to_datetime,
     parse_polygon,
     parse_rad_header,
     polygon_primitive,
@@ -219,10 +218,7 @@ class SensorConfig:
         if len(self.data) == 0:
             if self.file != "":
                 with open(self.file) as f:
-                    self.data = [
-                        [float(i) for i in line.split()]
-                        for line in f.readlines()
-                    ]
+                    self.data = np.loadtxt(f, ndmin=2).tolist()
             else:
                 raise ValueError("SensorConfig must have either file or data")
 
@@ -750,18 +746,6 @@ class PhaseMethod:
     ):
         if self.wea_str is None:
             raise ValueError("No weather string available")
-        _sun_str = pr.gendaymtx(
-            self.wea_str.encode(),
-            sun_file="-",
-            dryrun=True,
-            daylight_hours_only=True,
-        )
-        prims = pr.parse_primitive(_sun_str.decode())
-        _datetimes = [
-            minutes_to_datetime(2023, int(p.identifier.lstrip("solar")))
-            for p in prims
-            if p.ptype == "light"
-        ]
         _matrix = pr.gendaymtx(
             self.wea_str.encode(),
             sun_only=sun_only,
@@ -796,9 +780,13 @@ class TwoPhaseMethod(PhaseMethod):
             config: A WorkflowConfig object
         """
         super().__init__(config)
-        oct_stdin = config.model.materials.bytes + config.model.scene.bytes
-        for window in config.model.windows.values():
-            oct_stdin += window.bytes
+        oct_stdin = b"".join(
+            [
+                config.model.materials.bytes,
+                config.model.scene.bytes,
+                *(window.bytes for window in config.model.windows.values()),
+            ]
+        )
         with open(self.octree, "wb") as f:
             f.write(
                 pr.oconv(
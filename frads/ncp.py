@@ -38,6 +38,23 @@ class NcpModel:
     rbasis: str
 
 
+def _pipe_to_file(commands: List[List[str]], dest) -> None:
+    """Chain commands through OS pipes, streaming the last stdout to dest."""
+    procs: List[sp.Popen] = []
+    with open(dest, "wb") as wtr:
+        stdin = None
+        for idx, cmd in enumerate(commands):
+            stdout = wtr if idx == len(commands) - 1 else sp.PIPE
+            proc = sp.Popen(cmd, stdin=stdin, stdout=stdout)
+            if stdin is not None:
+                stdin.close()
+            stdin = proc.stdout
+            procs.append(proc)
+        for proc in procs:
+            if proc.wait() != 0:
+                raise sp.CalledProcessError(proc.returncode, proc.args)
+
+
 def ncp_compute_back(
     model: NcpModel, src: dict, opt: Optional[List[str]] = None, refl: bool = False
 ) -> None:
@@ -123,9 +140,7 @@ def klems_wrap(model, src_dict, fwrap_dict, out) -> None:
         for _, _ in enumerate(model.windows):
             inp = src_dict[key]
             rcmd = ["rmtxop", "-fa", "-t", "-c", ".265", ".67", ".065", inp]
-            ps1 = sp.run(rcmd, check=True, stdout=sp.PIPE)
-            with open(fwrap_dict[key], "wb") as wtr:
-                sp.run(["getinfo", "-"], check=True, input=ps1.stdout, stdout=wtr)
+            _pipe_to_file([rcmd, ["getinfo", "-"]], fwrap_dict[key])
     for i, _ in enumerate(model.windows):
         out_name = out.parent / (out.stem + f"{i}.xml")
         sub_dict = {k: fwrap_dict[k] for k in fwrap_dict if k.endswith(str(i))}
@@ -184,42 +199,19 @@ def rttree_reduce(
     if os.name == "posix":
         cmd.insert(1, "-if3")
     if pctcull >= 0:
-        avg = "-a" if refl else ""
         pcull = pctcull if spec == "Visible" else (100 - (100 - pctcull) * 0.25)
-        rtcmd = [
-            "rttree_reduce",
-            avg,
-            "-h",
-            "-ff",
-            "-t",
-            pcull,
-            "-r",
-            ttrank,
-            "-g",
-            ttlog2,
-        ]
+        rtcmd = ["rttree_reduce"] + (["-a"] if refl else [])
+        rtcmd += ["-h", "-ff", "-t", str(pcull), "-r", str(ttrank), "-g", str(ttlog2)]
         if os.name == "posix":
-            cmd.extend(["-of", src])
-            ps1 = sp.run(cmd + ["-of", src], check=True, stdout=sp.PIPE)
-            with open(dest, "wb") as wtr:
-                ps2 = sp.run(rtcmd, check=True, input=ps1.stdout, stdout=wtr)
+            _pipe_to_file([cmd + ["-of", src], rtcmd], dest)
         else:
-            ps1 = sp.run(
-                ["rcollate", "-ho", "-oc", "1", src], check=True, stdout=sp.PIPE
-            )
-            ps2 = sp.run(cmd, check=True, input=ps1.stdout, stdout=sp.PIPE)
-            with open(dest, "wb") as wtr:
-                sp.run(rtcmd, check=True, input=ps2.stdout, stdout=wtr)
+            rccmd = ["rcollate", "-ho", "-oc", "1", src]
+            _pipe_to_file([rccmd, cmd, rtcmd], dest)
     else:
         if os.name == "posix":
-            with open(dest, "wb") as wtr:
-                sp.run(cmd.append(src), check=True, stdout=wtr)
+            _pipe_to_file([cmd + [src]], dest)
         else:
-            ps1 = sp.run(
-                ["rcollate", "-ho", "-oc", "1", src], check=True, stdout=sp.PIPE
-            )
-            with open(dest, "wb") as wtr:
-                sp.run(cmd, check=True, input=ps1.stdout, stdout=wtr)
+            _pipe_to_file([["rcollate", "-ho", "-oc", "1", src], cmd], dest)
 
 
 def tt_wrap(model, src_dict, fwrap_dict, out, refl) -> None:
@@ -1,9 +1,11 @@
+from collections import Counter
 from dataclasses import dataclass
+from itertools import chain
 from typing import List, Optional, Tuple
 
 import pyradiance as pr
 from pyradiance.lib import Primitive
-from frads.geom import Polygon
+from frads.geom import Polygon, rotation_matrix
 from frads import utils
 import numpy as np
 
@@ -40,15 +42,20 @@ class Surface:
 
     def rotate_z(self, radians):
         """Rotate the surface counter clock-wise."""
-        center = np.zeros(3)
-        zaxis = np.array((0, 0, 1))
-        new_base = self.base.rotate(center, zaxis, radians)
+        # Rotate every vertex of the base, polygons and windows in one matmul.
+        rmtx = rotation_matrix(np.array((0, 0, 1)), radians)
+        polygons = [self.base, *self.polygons, *(w.polygon for w in self.windows)]
+        sizes = [len(plg.vertices) for plg in polygons]
+        vertices = np.vstack([plg.vertices for plg in polygons]) @ rmtx.T
+        rotated = [Polygon(v) for v in np.split(vertices, np.cumsum(sizes)[:-1])]
+        new_base = rotated[0]
+        new_polygons = rotated[1 : len(self.polygons) + 1]
+        new_window_polygons = rotated[len(self.polygons) + 1 :]
         new_base_primitive = utils.polygon_primitive(
             polygon=new_base,
             modifier=self.base_primitive.modifier,
             identifier=self.base_primitive.identifier,
         )
-        new_polygons = [plg.rotate(center, zaxis, radians) for plg in self.polygons]
         new_primitives = []
         for idx, polygon in enumerate(new_polygons):
             new_primitives.append(
@@ -59,8 +66,7 @@ class Surface:
                 )
             )
         new_windows = []
-        for window in self.windows:
-            new_polygon = window.polygon.rotate(center, zaxis, radians)
+        for window, new_polygon in zip(self.windows, new_window_polygons):
             new_primitive = utils.polygon_primitive(
                 polygon=new_polygon,
                 modifier=window.primitive.modifier,
@@ -87,23 +93,27 @@ class Room:
     wwall: Surface
     materials: List[Primitive]
 
+    def _iter_primitives(self):
+        return chain.from_iterable(
+            srf.primitives
+            for srf in (
+                self.floor,
+                self.ceiling,
+                self.swall,
+                self.ewall,
+                self.nwall,
+                self.wwall,
+            )
+        )
+
     def primitives(self) -> List[pr.Primitive]:
-        return [
-            *self.floor.primitives,
-            *self.ceiling.primitives,
-            *self.swall.primitives,
-            *self.ewall.primitives,
-            *self.nwall.primitives,
-            *self.wwall.primitives,
-        ]
+        return list(self._iter_primitives())
 
     def window_primitives(self) -> List[pr.Primitive]:
         return [
-            *[srf.primitive for srf in self.ceiling.windows],
-            *[srf.primitive for srf in self.swall.windows],
-            *[srf.primitive for srf in self.ewall.windows],
-            *[srf.primitive for srf in self.nwall.windows],
-            *[srf.primitive for srf in self.wwall.windows],
+            win.primitive
+            for srf in (self.ceiling, self.swall, self.ewall, self.nwall, self.wwall)
+            for win in srf.windows
         ]
 
 
@@ -136,8 +146,8 @@ class Room:
 
     def validate(self) -> None:
         """Validate the room model."""
-        material_names = [p.identifier for p in self.materials]
-        for prim in self.primitives():
+        material_names = {p.identifier for p in self.materials}
+        for prim in self._iter_primitives():
             if prim.modifier not in material_names:
                 raise ValueError(
                     f"Unknown modifier {prim.modifier} in {prim.identifier}"
@@ -148,10 +158,12 @@ def thicken(base, thickness) -> List[Polygon]:
     """Thicken the surface."""
     direction = base.normal * thickness
     polygons = base.extrude(direction)
-    # Remove duplicates.
-    counts = [polygons.count(plg) for plg in polygons]
-    polygons = [plg for plg, cnt in zip(polygons, counts) if cnt == 1]
-    return polygons
+    # Remove duplicates, keyed the same way Polygon.__eq__ compares.
+    keys = [
+        (len(plg.vertices), frozenset(map(tuple, plg.vertices))) for plg in polygons
+    ]
+    counts = Counter(keys)
+    return [plg for plg, key in zip(polygons, keys) if counts[key] == 1]
 
 
 def make_window(
@@ -244,12 +256,8 @@ def create_surface(
         A Surface object.
     """
     vertices = base.vertices
-    vec1 = (vertices[1] - vertices[0]) / np.linalg.norm(
-        vertices[1] - vertices[0]
-    )
-    vec2 = (vertices[2] - vertices[1]) / np.linalg.norm(
-        vertices[2] - vertices[1]
-    )
+    edges = vertices[1:3] - vertices[0:2]
+    vec1, vec2 = edges / np.linalg.norm(edges, axis=1, keepdims=True)
     polygons = [base]
     windows = []
     base_primitive = utils.polygon_primitive(
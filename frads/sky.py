@@ -3,16 +3,24 @@ Routines for generating sky models
 """
 
 import datetime
+import io
 import logging
 import math
 import os
+import warnings
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pyradiance as pr
 
 logger: logging.Logger = logging.getLogger("frads.sky")
 
+# EPW hours run 1-24 and mark the end of the hour; data are centered on :30.
+_EPW_HOUR_OFFSETS = {
+    hour: datetime.timedelta(hours=hour - 1, minutes=30) for hour in range(1, 25)
+}
+
 
 class WeaMetaData(NamedTuple):
     """Weather related meta data object.
@@ -86,27 +94,21 @@ def parse_epw(epw_str: str) -> tuple:
     """
     raw = epw_str.splitlines()
     epw_header = raw[0].split(",")
-    content = raw[8:]
-    data = []
-    for li in content:
-        line = li.split(",")
-        year = int(line[0])
-        month = int(line[1])
-        day = int(line[2])
-        hour = int(line[3]) - 1
-        dir_norm = float(line[14])
-        dif_hor = float(line[15])
-        cc = float(line[19])
-        aod = float(line[26])
-        data.append(
-            WeaData(
-                datetime.datetime(year, month, day, hour, 30),
-                dir_norm,
-                dif_hor,
-                cc,
-                aod,
-            )
-        )
+    # Convert only the needed columns, all rows at once.
+    columns = np.loadtxt(
+        raw[8:], delimiter=",", usecols=(0, 1, 2, 3, 14, 15, 19, 26), ndmin=2
+    )
+    years, months, days, hours = columns[:, :4].astype(int).T.tolist()
+    dir_norm, dif_hor, cc, aod = columns[:, 4:].T.tolist()
+    # Rows share dates 24 at a time, so build each date once and add the
+    # hour offset rather than constructing a full datetime per row.
+    dates: Dict[Tuple[int, int, int], datetime.datetime] = {}
+    times = []
+    for yr, mo, da, hr in zip(years, months, days, hours):
+        if (date := dates.get((yr, mo, da))) is None:
+            date = dates[(yr, mo, da)] = datetime.datetime(yr, mo, da)
+        times.append(date + _EPW_HOUR_OFFSETS[hr])
+    data = list(map(WeaData._make, zip(times, dir_norm, dif_hor, cc, aod)))
     city = epw_header[1]
     country = epw_header[3]
     latitude = float(epw_header[6])
@@ -125,30 +127,31 @@ def parse_wea(wea_str: str) -> Tuple[WeaMetaData, List[WeaData]]:
     Returns:
         Tuple of meta data and wea data.
     """
-    lines = wea_str.splitlines()
-    place = lines[0].split(" ", 1)[1]
-    lat = float(lines[1].split(" ", 1)[1])
-    lon = float(lines[2].split(" ", 1)[1])
-    tz = int(float(lines[3].split(" ", 1)[1]))
-    ele = float(lines[4].split(" ", 1)[1])
+    # Stream the lines rather than materializing a list of the whole file.
+    lines = io.StringIO(wea_str)
+    header = [next(lines).rstrip("\r\n").split(" ", 1)[1] for _ in range(5)]
+    next(lines)
+    place = header[0]
+    lat = float(header[1])
+    lon = float(header[2])
+    tz = int(float(header[3]))
+    ele = float(header[4])
     meta_data = WeaMetaData(place, "", lat, lon, tz, ele)
     year = datetime.datetime.today().year
+    with warnings.catch_warnings():
+        # An empty data section is valid and yields no records.
+        warnings.filterwarnings(
+            "ignore", message=".*input contained no data", category=UserWarning
+        )
+        columns = np.loadtxt(lines, usecols=(0, 1, 2, 3, 4), ndmin=2)
+    months, days = columns[:, :2].astype(int).T.tolist()
+    hours, dir_norm, dif_hor = columns[:, 2:].T.tolist()
     data = []
-    for li in lines[6:]:
-        if li.strip() == "":
-            continue
-        line = li.split()
-        month = int(line[0])
-        day = int(line[1])
-        hours = float(line[2])
-        hour = int(hours)
-        minute = int((hours - hour) * 60)
-        dir_norm = float(line[3])
-        dif_hor = float(line[4])
+    for month, day, hrs, dni, dhi in zip(months, days, hours, dir_norm, dif_hor):
+        hour = int(hrs)
+        minute = int((hrs - hour) * 60)
         data.append(
-            WeaData(
-                datetime.datetime(year, month, day, hour, minute), dir_norm, dif_hor
-            )
+            WeaData(datetime.datetime(year, month, day, hour, minute), dni, dhi)
         )
     return meta_data, data
 
@@ -18,6 +18,8 @@ from pyradiance import Primitive, parse_primitive, pvaluer
 
 logger: logging.Logger = logging.getLogger("frads.utils")
 
+_RAD_HEADER_RE = re.compile(r"(NROWS|NCOLS|NCOMP|FORMAT)=(\S+)")
+
 
 def parse_rad_header(header_str: str) -> tuple:
     """Parse a Radiance matrix file header.
@@ -29,16 +31,13 @@ def parse_rad_header(header_str: str) -> tuple:
     Raises:
         ValueError: if any of NROWS NCOLS NCOMP FORMAT is not found.
     """
-    compiled = re.compile(
-        r" NROWS=(.*) | NCOLS=(.*) | NCOMP=(.*) | FORMAT=(.*) ", flags=re.X
-    )
-    matches = compiled.findall(header_str)
-    if len(matches) != 4:
+    entries = {m.group(1): m.group(2) for m in _RAD_HEADER_RE.finditer(header_str)}
+    if len(entries) != 4:
         raise ValueError("Can't find one of the header entries.")
-    nrow = int([mat[0] for mat in matches if mat[0] != ""][0])
-    ncol = int([mat[1] for mat in matches if mat[1] != ""][0])
-    ncomp = int([mat[2] for mat in matches if mat[2] != ""][0])
-    dtype = [mat[3] for mat in matches if mat[3] != ""][0].strip()
+    nrow = int(entries["NROWS"])
+    ncol = int(entries["NCOLS"])
+    ncomp = int(entries["NCOMP"])
+    dtype = entries["FORMAT"]
     return nrow, ncol, ncomp, dtype
 
 
@@ -68,10 +67,7 @@ def parse_polygon(primitive: Primitive) -> geom.Polygon:
     """
     if primitive.ptype != "polygon":
         raise ValueError("Not a polygon: ", primitive.identifier)
-    vertices = [
-        np.array(primitive.fargs[i : i + 3]) for i in range(0, len(primitive.fargs), 3)
-    ]
-    return geom.Polygon(vertices)
+    return geom.Polygon(np.asarray(primitive.fargs, dtype=float).reshape(-1, 3))
 
 
 def array_hdr(array: np.ndarray, xres: int, yres: int, dtype: str = "d") -> bytes:
@@ -280,12 +276,14 @@ def add_manikin(
     )
     with open(manikin_file) as f:
         manikin_primitives = parse_primitive(f.read())
-    non_polygon_primitives = [p for p in manikin_primitives if p.ptype != "polygon"]
-    for primitive in non_polygon_primitives:
-        zone["model"]["scene"]["bytes"] += primitive.bytes
-    manikin_polygons = [
-        parse_polygon(p) for p in manikin_primitives if p.ptype == "polygon"
-    ]
+    scene_bytes = [zone["model"]["scene"]["bytes"]]
+    polygon_primitives = []
+    for primitive in manikin_primitives:
+        if primitive.ptype == "polygon":
+            polygon_primitives.append(primitive)
+        else:
+            scene_bytes.append(primitive.bytes)
+    manikin_polygons = [parse_polygon(p) for p in polygon_primitives]
     xminm, xmaxm, yminm, ymaxm, zminm, _ = geom.get_polygon_limits(manikin_polygons)
     manikin_base_center = np.array([(xmaxm - xminm) / 2, (ymaxm - yminm) / 2, zminm])
     if rotation != 0:
@@ -296,11 +294,11 @@ def add_manikin(
     move_vector = manikin_base_center - target
     moved_manikin_polygons = [polygon.move(move_vector) for polygon in manikin_polygons]
     moved_manikin = [
-        polygon2prim(polygon, primitive.modifier, primitive.identifier)
-        for polygon, primitive in zip(moved_manikin_polygons, manikin_primitives)
+        polygon_primitive(polygon, primitive.modifier, primitive.identifier)
+        for polygon, primitive in zip(moved_manikin_polygons, polygon_primitives)
     ]
-    for primitive in moved_manikin:
-        zone["model"]["scene"]["bytes"] += primitive.bytes
+    scene_bytes.extend(primitive.bytes for primitive in moved_manikin)
+    zone["model"]["scene"]["bytes"] = b"".join(scene_bytes)
     manikin_rays = []
     for polygon in moved_manikin_polygons:
         manikin_rays.append([*polygon.centroid.tolist(), *polygon.normal.tolist()])
@@ -387,30 +385,27 @@ def opt2list(opt: dict) -> List[str]:
     return out
 
 
+def _winding_numbers(pts: np.ndarray, polygon_pts: List[np.ndarray]) -> np.ndarray:
+    """Winding numbers of many points against one polygon, evaluated as a
+    points-by-edges array."""
+    start = np.asarray(polygon_pts, dtype=float)[:, :2]
+    end = np.roll(start, -1, axis=0)
+    px = np.asarray(pts, dtype=float)[:, 0, None]
+    py = np.asarray(pts, dtype=float)[:, 1, None]
+    # Crossing direction and side-of-edge tests are boolean masks
+    # instead of a per-edge branch ladder.
+    is_left = (end[:, 0] - start[:, 0]) * (py - start[:, 1]) - (px - start[:, 0]) * (
+        end[:, 1] - start[:, 1]
+    )
+    upward = (start[:, 1] <= py) & (end[:, 1] > py) & (is_left > 0)
+    downward = (start[:, 1] > py) & (end[:, 1] <= py) & (is_left < 0)
+    return np.count_nonzero(upward, axis=1) - np.count_nonzero(downward, axis=1)
+
+
 def pt_inclusion(pt: np.ndarray, polygon_pts: List[np.ndarray]) -> int:
     """Test whether a point is inside a polygon
     using winding number algorithm."""
-
-    def isLeft(pt0, pt1, pt2):
-        """Test whether a point is left to a line."""
-        return (pt1[0] - pt0[0]) * (pt2[1] - pt0[1]) - (pt2[0] - pt0[0]) * (
-            pt1[1] - pt0[1]
-        )
-
-    # Close the polygon for looping
-    # polygon_pts.append(polygon_pts[0])
-    polygon_pts = [*polygon_pts, polygon_pts[0]]
-    wn = 0
-    for i in range(len(polygon_pts) - 1):
-        if polygon_pts[i][1] <= pt[1]:
-            if polygon_pts[i + 1][1] > pt[1]:
-                if isLeft(polygon_pts[i], polygon_pts[i + 1], pt) > 0:
-                    wn += 1
-        else:
-            if polygon_pts[i + 1][1] <= pt[1]:
-                if isLeft(polygon_pts[i], polygon_pts[i + 1], pt) < 0:
-                    wn -= 1
-    return wn
+    return int(_winding_numbers(np.asarray(pt)[None, :], polygon_pts)[0])
 
 
 def gen_grid(polygon: geom.Polygon, height: float, spacing: float) -> List[List[float]]:
@@ -434,17 +429,18 @@ def gen_grid(polygon: geom.Polygon, height: float, spacing: float) -> List[List[
     y0 = np.arange(jmin, jmax, spacing) + ystart
     grid_dir = polygon.normal * -1
     grid_hgt = np.array((0, 0, plane_height)) + grid_dir * height
-    raw_pts = [
-        np.array((round(i, 3), round(j, 3), round(grid_hgt[2], 3)))
-        for i in x0
-        for j in y0
-    ]
+    xs, ys = np.meshgrid(
+        [round(i, 3) for i in x0], [round(j, 3) for j in y0], indexing="ij"
+    )
+    raw_pts = np.column_stack(
+        (xs.ravel(), ys.ravel(), np.full(xs.size, round(grid_hgt[2], 3)))
+    )
     if np.array_equal(polygon.normal, np.array((0, 0, 1))):
-        _grid = [p for p in raw_pts if pt_inclusion(p, vertices) > 0]
+        inside = _winding_numbers(raw_pts, vertices) > 0
     else:
-        _grid = [p for p in raw_pts if pt_inclusion(p, vertices[::-1]) > 0]
-    grid = [p.tolist() + grid_dir.tolist() for p in _grid]
-    return grid
+        inside = _winding_numbers(raw_pts, vertices[::-1]) > 0
+    grid_dir_list = grid_dir.tolist()
+    return [p + grid_dir_list for p in raw_pts[inside].tolist()]
 
 
 def material_lib() -> Dict[str, Primitive]:
@@ -467,11 +463,12 @@ def material_lib() -> Dict[str, Primitive]:
 def gen_blinds(depth, width, height, spacing, angle, curve, movedown) -> str:
     """Generate genblinds command for genBSDF."""
     nslats = int(round(height / spacing, 0))
-    slat_cmd = "!genblinds blindmaterial blinds "
-    slat_cmd += f"{depth} {width} {height} {nslats} {angle} {curve}"
-    slat_cmd += "| xform -rz -90 -rx -90 -t "
-    slat_cmd += f"{-width/2} {-height/2} {-movedown}\n"
-    return slat_cmd
+    return (
+        "!genblinds blindmaterial blinds "
+        f"{depth} {width} {height} {nslats} {angle} {curve}"
+        "| xform -rz -90 -rx -90 -t "
+        f"{-width/2} {-height/2} {-movedown}\n"
+    )
 
 
 def batch_process(
@@ -5,6 +5,7 @@ from pathlib import Path
 import tempfile
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pyradiance as pr
 import pywincalc as pwc
 
@@ -345,18 +346,20 @@ def get_layer_rgb(layer: pwc.ProductData) -> PaneRGB:
             trans_rgb=(0, 0, 0),
             coated_side=None,
         )
-    hemi = {
-        int(round(d.wavelength * 1e3)): (
-            d.direct_component.transmittance_front,
-            d.direct_component.transmittance_back,
-            d.direct_component.reflectance_front,
-            d.direct_component.reflectance_back,
-        )
-        for d in layer.measurements
-    }
-    tvf = [hemi[w][0] for w in photopic_wvl]
-    rvf = [hemi[w][2] for w in photopic_wvl]
-    rvb = [hemi[w][3] for w in photopic_wvl]
+    spectral = np.array(
+        [
+            (
+                d.wavelength,
+                d.direct_component.transmittance_front,
+                d.direct_component.reflectance_front,
+                d.direct_component.reflectance_back,
+            )
+            for d in layer.measurements
+        ]
+    )
+    wavelengths = np.rint(spectral[:, 0] * 1e3).astype(int).tolist()
+    row = {w: i for i, w in enumerate(wavelengths)}
+    tvf, rvf, rvb = spectral[[row[w] for w in photopic_wvl], 1:].T.tolist()
     tf_x, tf_y, tf_z = pr.spec_xyz(tvf, 380, 780)
     rf_x, rf_y, rf_z = pr.spec_xyz(rvf, 380, 780)
     rb_x, rb_y, rb_z = pr.spec_xyz(rvb, 380, 780)
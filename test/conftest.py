@@ -10,3 +10,14 @@ def resources_dir():
 @pytest.fixture(scope="session")
 def objects_dir():
     yield Path(__file__).parent / "Objects"
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Private working directory for tests that write relative to it.
+
+    Phase methods create Temp, Octrees and Matrices and EnergyPlus writes
+    eplusout.* in the working directory, so concurrent tests must not share one.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
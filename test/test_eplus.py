@@ -7,7 +7,7 @@ import pytest
 
 
 @pytest.fixture
-def medium_office():
+def medium_office(workdir):
     return load_energyplus_model(ref_models["medium_office"])
 
 
@@ -1,10 +1,9 @@
-from pathlib import Path
 from frads import geom, matrix, utils
 import pyradiance as pr
 import numpy as np
 import pytest
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def window_polygon():
     return [
         geom.Polygon([np.array((0, 0.6667, 0)),
@@ -19,7 +18,7 @@ def window_polygon():
                       ])
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def window_primitives(window_polygon):
     return [
         pr.Primitive("void", "polygon", "window1", ("0"), window_polygon[0].coordinates),
@@ -53,6 +52,7 @@ def test_point_as_sender():
     ray_cnt = 5
     sender = matrix.SensorSender(pts_list, ray_cnt)
     assert sender.yres == len(pts_list)
+    assert len(sender.sensors) == ray_cnt * len(pts_list)
 
 def test_surface_as_receiver(window_primitives):
     basis = "kf"
@@ -63,11 +63,12 @@ def test_surface_as_receiver(window_primitives):
     assert receiver.basis == 'kf'
 
 
-def test_sky_as_receiver():
+def test_sky_as_receiver(tmp_path):
     basis = 'r1'
-    out = Path("test.mtx")
-    receiver = matrix.SkyReceiver(basis)
+    out = tmp_path / "test.mtx"
+    receiver = matrix.SkyReceiver(basis, out=out)
     assert receiver.basis == 'r1'
+    assert f"o={out}" in receiver.content
 
 
 def test_sun_as_receiver():
@@ -77,6 +78,15 @@ def test_sun_as_receiver():
     receiver = matrix.SunReceiver(basis, smx_path, window_normals)
     assert receiver.basis == "r6"
 
+
+def test_sun_as_receiver_window_normals():
+    south = matrix.SunReceiver("r1", window_normals=[np.array([0, 1, 0])])
+    both = matrix.SunReceiver(
+        "r1", window_normals=[np.array([0, 1, 0]), np.array([1, 0, 0])]
+    )
+    assert len(south.content.splitlines()) == len(both.content.splitlines())
+    assert set(south.modifiers) < set(both.modifiers)
+
 def test_surfaces_view_factor():
     mat = pr.Primitive(
         "void", "plastic", "mat", [], [0.5, 0.5, 0.5]
@@ -1,4 +1,11 @@
+import copy
+from contextlib import contextmanager
 from datetime import datetime
+import hashlib
+from importlib.metadata import version
+import os
+import pickle
+import tempfile
 
 from frads.methods import (
     TwoPhaseMethod,
@@ -13,6 +20,7 @@ from frads.methods import (
     SensorConfig,
     SurfaceConfig,
 )
+from frads import window
 from frads.window import create_glazing_system, Gap, Gas
 from frads.ep2rad import epmodel_to_radmodel
 from frads.eplus import load_energyplus_model
@@ -21,8 +29,42 @@ from pyenergyplus.dataset import ref_models, weather_files
 import pyradiance as pr
 
 
-@pytest.fixture
-def cfg(resources_dir, objects_dir):
+def _cached(cache_dir, key, inputs, func, *args, **kwargs):
+    """Call func, or reload its pickled result from cache_dir.
+
+    The pickle name hashes the arguments and the pywincalc version, and the
+    pickle is reused only while it is newer than every input file. Without
+    a cache_dir func is simply called.
+    """
+    if cache_dir is None:
+        return func(*args, **kwargs)
+    signature = repr((args, sorted(kwargs.items()), version("pywincalc")))
+    digest = hashlib.sha256(signature.encode()).hexdigest()[:16]
+    path = cache_dir / f"{key}-{digest}.pkl"
+    newest = max(os.path.getmtime(i) for i in inputs)
+    if path.exists() and path.stat().st_mtime > newest:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    result = func(*args, **kwargs)
+    # Write aside and rename, so concurrent workers never read a partial file.
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(result, f)
+    os.replace(tmp, path)
+    return result
+
+
+@contextmanager
+def _working_directory(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(cwd)
+
+
+def _workflow_dict(resources_dir, objects_dir):
     return {
         "settings": {
             "method": "2phase",
@@ -69,8 +111,8 @@ def cfg(resources_dir, objects_dir):
             "views": {
                 "view1": {
                     "file": resources_dir / "v1a.vf",
-                    "xres": 16,
-                    "yres": 16,
+                    "xres": 4,
+                    "yres": 4,
                 }
             },
             "surfaces": {},
@@ -78,6 +120,18 @@ def cfg(resources_dir, objects_dir):
     }
 
 
+@pytest.fixture
+def cfg(resources_dir, objects_dir):
+    return _workflow_dict(resources_dir, objects_dir)
+
+
+@pytest.fixture(scope="session")
+def workflow_config(resources_dir, objects_dir):
+    # from_dict turns the nested dicts into config objects in place, so build
+    # from a dict of its own; tests take private copies of the result.
+    return WorkflowConfig.from_dict(_workflow_dict(resources_dir, objects_dir))
+
+
 @pytest.fixture
 def scene(objects_dir):
     return SceneConfig(
@@ -238,7 +292,9 @@ def test_windows_not_specified_for_3phase_or_5phase_method(
         WorkflowConfig(settings, model)
 
 
-def test_three_phase2(scene, window_2, materials, wpi, sensor_view_1, view_1):
+def test_three_phase2(
+    workdir, scene, window_2, materials, wpi, sensor_view_1, view_1
+):
     model = Model(
         scene=scene,
         windows={"window_1": window_2},  # window_2 has no matrix_name
@@ -261,22 +317,27 @@ def test_three_phase2(scene, window_2, materials, wpi, sensor_view_1, view_1):
     assert a.shape == (1, 1)
 
 
-def test_two_phase(cfg):
+def test_two_phase(workdir, workflow_config):
     time = datetime(2023, 1, 1, 12)
     dni = 800
     dhi = 100
-    config = WorkflowConfig.from_dict(cfg)
+    config = copy.deepcopy(workflow_config)
     with TwoPhaseMethod(config) as workflow:
         workflow.generate_matrices()
         res = workflow.calculate_sensor("wpi", time, dni, dhi)
     assert res.shape == (195, 1)
 
 
-def test_three_phase(cfg, resources_dir):
-    time = datetime(2023, 1, 1, 12)
-    dni = 800
-    dhi = 100
-    config = WorkflowConfig.from_dict(cfg)
+@pytest.fixture(scope="module")
+def three_phase_workflow(workflow_config, resources_dir, tmp_path_factory):
+    """ThreePhaseMethod with matrices generated, shared across the module.
+
+    The workflow keeps paths relative to its own tmp directory, so the fixture
+    stays in that directory until module teardown; later tests in this module
+    inherit that working directory unless they request workdir.
+    """
+    # The glazing materials are set below, so work on a private copy.
+    config = copy.deepcopy(workflow_config)
     blind_prim = pr.Primitive(
         "void",
         "aBSDF",
@@ -285,46 +346,82 @@ def test_three_phase(cfg, resources_dir):
         [],
     )
     config.model.materials.glazing_materials = {"blinds30": blind_prim}
-    with ThreePhaseMethod(config) as workflow:
+    workdir = tmp_path_factory.mktemp("three_phase")
+    with _working_directory(workdir), ThreePhaseMethod(config) as workflow:
         workflow.generate_matrices(view_matrices=False)
-        workflow.calculate_sensor(
-            "wpi",
-            {"upper_glass": "blinds30", "lower_glass": "blinds30"},
-            time,
-            dni,
-            dhi,
-        )
-        res = workflow.calculate_edgps(
-            "view1",
-            {"upper_glass": "blinds30", "lower_glass": "blinds30"},
-            time,
-            dni,
-            dhi,
-        )
-        res = workflow.calculate_sensor_from_wea("wpi")
+        yield workflow
 
 
-def test_eprad_threephase(resources_dir):
-    """
-    Integration test for ThreePhaseMethod using EnergyPlusModel and GlazingSystem
+THREE_PHASE_BSDF = {"upper_glass": "blinds30", "lower_glass": "blinds30"}
+
+
+def test_three_phase_sensor(three_phase_workflow):
+    time = datetime(2023, 1, 1, 12)
+    dni = 800
+    dhi = 100
+    res = three_phase_workflow.calculate_sensor(
+        "wpi", THREE_PHASE_BSDF, time, dni, dhi
+    )
+    assert res.shape == (195, 1)
+
+
+def test_three_phase_edgps(three_phase_workflow):
+    time = datetime(2023, 1, 1, 12)
+    dni = 800
+    dhi = 100
+    res = three_phase_workflow.calculate_edgps(
+        "view1", THREE_PHASE_BSDF, time, dni, dhi
+    )
+    assert 0 <= res <= 1
+
+
+def test_three_phase_sensor_from_wea(three_phase_workflow):
+    res = three_phase_workflow.calculate_sensor_from_wea("wpi")
+    assert res.shape[0] == 195
+
+
+EPRAD_ZONE = "Perimeter_bot_ZN_1"
+
+
+@pytest.fixture(scope="module")
+def eprad_workflow(request, resources_dir, tmp_path_factory):
+    """ThreePhaseMethod with matrices generated, shared across the module.
+
+    Like three_phase_workflow, it stays in its tmp directory until module
+    teardown, and later tests in this module inherit that working directory.
     """
     view_path = resources_dir / "view1.vf"
     clear_glass_path = resources_dir / "CLEAR_3.DAT"
     product_7406_path = resources_dir / "igsdb_product_7406.json"
     shade_bsdf_path = resources_dir / "ec60.xml"
-
-    epmodel = load_energyplus_model(ref_models["medium_office"])
-    gs_ec60 = create_glazing_system(
+    idf_path = ref_models["medium_office"]
+    epw_path = weather_files["usa_ca_san_francisco"]
+    for path in (
+        idf_path,
+        epw_path,
+        view_path,
+        clear_glass_path,
+        product_7406_path,
+        shade_bsdf_path,
+    ):
+        if not os.path.exists(path):
+            pytest.skip(f"missing {path}")
+
+    epmodel = load_energyplus_model(idf_path)
+    # The glazing system solve dominates this fixture, so reuse it across runs.
+    cache = getattr(request.config, "cache", None)
+    gs_ec60 = _cached(
+        None if cache is None else cache.mkdir("frads_glazing"),
+        "gs_ec60",
+        [product_7406_path, clear_glass_path, window.__file__, __file__],
+        create_glazing_system,
         name="ec60",
         layers=[product_7406_path, clear_glass_path],
         gaps=[Gap([Gas("air", 0.1), Gas("argon", 0.9)], 0.0127)],
     )
     epmodel.add_glazing_system(gs_ec60)
-    rad_models = epmodel_to_radmodel(
-        epmodel, epw_file=weather_files["usa_ca_san_francisco"]
-    )
-    zone = "Perimeter_bot_ZN_1"
-    zone_dict = rad_models[zone]
+    rad_models = epmodel_to_radmodel(epmodel, epw_file=epw_path)
+    zone_dict = rad_models[EPRAD_ZONE]
     zone_dict["model"]["views"]["view1"] = {
         "file": view_path,
         "xres": 16,
@@ -341,35 +438,41 @@ def test_eprad_threephase(resources_dir):
     rad_cfg.settings.sensor_window_matrix = ["-ab", "0"]
     rad_cfg.settings.view_window_matrix = ["-ab", "0"]
     rad_cfg.settings.daylight_matrix = ["-ab", "0"]
-    with ThreePhaseMethod(rad_cfg) as rad_workflow:
+    workdir = tmp_path_factory.mktemp("eprad")
+    with _working_directory(workdir), ThreePhaseMethod(rad_cfg) as rad_workflow:
         rad_workflow.generate_matrices(view_matrices=False)
-        dni = 800
-        dhi = 100
-        dt = datetime(2023, 1, 1, 12)
-        edgps = rad_workflow.calculate_edgps(
-            view="view1",
-            bsdf={f"{zone}_Wall_South_Window": "ec60"},
-            time=dt,
-            dni=dni,
-            dhi=dhi,
-            ambient_bounce=1,
-        )
+        yield rad_workflow
 
-    assert "view1" in rad_workflow.view_senders
-    assert rad_workflow.view_senders["view1"].view.vtype == "a"
-    assert rad_workflow.view_senders["view1"].view.position == [6.0, 7.0, 0.76]
-    assert rad_workflow.view_senders["view1"].view.direction == [0.0, -1.0, 0.0]
-    assert rad_workflow.view_senders["view1"].view.horiz == 180
-    assert rad_workflow.view_senders["view1"].view.vert == 180
-    assert rad_workflow.view_senders["view1"].xres == 16
-
-    assert list(rad_workflow.daylight_matrices.values())[0].array.shape == (
-        145,
-        146,
-        3,
-    )
-    assert (
-        list(rad_workflow.sensor_window_matrices.values())[0].ncols == [145]
-        and list(rad_workflow.sensor_window_matrices.values())[0].ncomp == 3
+
+def test_eprad_threephase(eprad_workflow):
+    """
+    Integration test for ThreePhaseMethod using EnergyPlusModel and GlazingSystem
+    """
+    rad_workflow = eprad_workflow
+    dni = 800
+    dhi = 100
+    dt = datetime(2023, 1, 1, 12)
+    edgps = rad_workflow.calculate_edgps(
+        view="view1",
+        bsdf={f"{EPRAD_ZONE}_Wall_South_Window": "ec60"},
+        time=dt,
+        dni=dni,
+        dhi=dhi,
+        ambient_bounce=1,
     )
+
+    assert "view1" in rad_workflow.view_senders
+    view_sender = rad_workflow.view_senders["view1"]
+    view = view_sender.view
+    assert view.vtype == "a"
+    assert view.position == [6.0, 7.0, 0.76]
+    assert view.direction == [0.0, -1.0, 0.0]
+    assert view.horiz == 180
+    assert view.vert == 180
+    assert view_sender.xres == 16
+
+    daylight_matrix = next(iter(rad_workflow.daylight_matrices.values()))
+    assert daylight_matrix.array.shape == (145, 146, 3)
+    sensor_window_matrix = next(iter(rad_workflow.sensor_window_matrices.values()))
+    assert sensor_window_matrix.ncols == [145] and sensor_window_matrix.ncomp == 3
     assert edgps >= 0 and edgps <= 1
@@ -93,3 +93,7 @@ def test_id_generator():
 
 def get_nested_list_levels():
     pass
+
+def test_parse_rad_header():
+    header = "#?RADIANCE\nNROWS=3\nNCOLS=145\nNCOMP=3\nFORMAT=float\n\n"
+    assert utils.parse_rad_header(header) == (3, 145, 3, "float")
@@ -20,7 +20,7 @@ def glazing_system(glass_path):
     )
     return gs
 
-def test_save_and_load(glazing_system):
+def test_save_and_load(workdir, glazing_system):
     """
     Test the save method of the GlazingSystem class.
     """